@@ -36,6 +36,14 @@ class BaseBoilerplate:
         """Get the directory for a year"""
         raise NotImplementedError()
 
+    def get_base_directory(self, relative: bool = False):
+        """
+        Get the directory that all the challenges are under, so that it can be
+        listed once instead of checking each part. Without one (the default),
+        each part is checked separately.
+        """
+        return None
+
     def get_part_module_name(self, year: int, day: int, part: str):
         """Get the module name for a part"""
         raise NotImplementedError()
@@ -2,10 +2,14 @@
 The default way to structure parts: `year_xxxx/day_xx/part_x.py`
 """
 
+import functools
+import os
 import re
 import shutil
+import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Tuple, Pattern
 
 import click
 
@@ -21,10 +25,104 @@ current_directory = get_current_directory()
 __all__ = ['DefaultBoilerplate']
 
 
+# Either separator is accepted, so that Windows paths can be parsed too
+RE_FILENAME = re.compile(
+    r"(?:^|[/\\])year_(\d+)[/\\]day_(\d+)[/\\]part_([ab])\.py\Z")
+
+
+@functools.lru_cache(maxsize=512)
+def parse_part_filename(filename: str, re_filename: Pattern = RE_FILENAME
+                        ) -> Tuple[int, int, str]:
+    """
+    Parse year, day, and part from a filename, with a filename pattern.
+    Filenames and patterns are stable for the lifetime of the process, so
+    results are cached.
+    """
+    if re_filename is RE_FILENAME:
+        # Skip the regex for paths that can't contain a year directory
+        if "year_" in filename:
+            match = RE_FILENAME.search(filename)
+        else:
+            match = None
+    else:
+        # Custom patterns are matched from the start, as they always were
+        match = re_filename.match(filename)
+    if not match:
+        raise Exception(
+            f"Cannot parse filename '{filename}' as a valid challenge part "
+            f"filename")
+
+    year_str, day_str, part = match.groups()
+    year = int(year_str)
+    day = int(day_str)
+    # Parts are used as dict keys everywhere, so share a single string object
+    part = sys.intern(part)
+
+    return year, day, part
+
+
+def get_relative_path_string(year: int, day: Optional[int] = None,
+                             name: Optional[str] = None) -> str:
+    """
+    Build the relative path of a year, day, or day file as a single string, so
+    that only one `Path` needs to be constructed from it.
+
+    >>> get_relative_path_string(2020)
+    'year_2020'
+    >>> get_relative_path_string(2020, 5)
+    'year_2020/day_05'
+    >>> get_relative_path_string(2020, 15, 'part_a.py')
+    'year_2020/day_15/part_a.py'
+    """
+    if day is None:
+        return f"year_{year}"
+    if name is None:
+        return f"year_{year}/day_{day:0>2}"
+    return f"year_{year}/day_{day:0>2}/{name}"
+
+
+@functools.lru_cache(maxsize=1024)
+def get_year_path(base: Path, year: int) -> Path:
+    """
+    Get the year directory under a base directory. The base is part of the
+    cache key, so changing `challenges_root` doesn't return stale paths.
+    """
+    return base.joinpath(get_relative_path_string(year))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_day_path(base: Path, year: int, day: int) -> Path:
+    """Get the day directory under a base directory"""
+    return base.joinpath(get_relative_path_string(year, day))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_day_file_path(base: Path, year: int, day: int, name: str) -> Path:
+    """Get a file in the day directory under a base directory"""
+    return base.joinpath(get_relative_path_string(year, day, name))
+
+
+@functools.lru_cache(maxsize=1024)
+def get_module_name(root: Optional[str], year: int, day: int, part: str
+                    ) -> str:
+    """
+    Get the module name for a part, optionally under a root package
+
+    >>> get_module_name(None, 2020, 5, 'a')
+    'year_2020.day_05.part_a'
+    >>> get_module_name('custom.package', 2020, 15, 'b')
+    'custom.package.year_2020.day_15.part_b'
+    """
+    module_name = f"year_{year}.day_{day:0>2}.part_{part}"
+    if root:
+        return f"{root}.{module_name}"
+    return module_name
+
+
 @dataclass
 class DefaultBoilerplate(BaseBoilerplate):
     """The default way to structure parts `year_xxxx/day_xx/part_x.py`"""
-    re_filename = re.compile(r"^(?:.*/)?year_(\d+)/day_(\d+)/part_([ab]).py$")
+    re_filename = RE_FILENAME
 
     example_year_path: Path = current_directory\
         .joinpath('default_boilerplate_example_year')
@@ -43,6 +141,9 @@ class DefaultBoilerplate(BaseBoilerplate):
         ...     'year_2020/day_15/part_b.py')
         (2020, 15, 'b')
         >>> DefaultBoilerplate().extract_from_filename(
+        ...     'C:\\\\aoc\\\\year_2020\\\\day_15\\\\part_b.py')
+        (2020, 15, 'b')
+        >>> DefaultBoilerplate().extract_from_filename(
         ...     'year_2020/day_15/part_c.py')
         Traceback (most recent call last):
         ...
@@ -52,18 +153,30 @@ class DefaultBoilerplate(BaseBoilerplate):
         Traceback (most recent call last):
         ...
         Exception: ...
-        """
-        match = self.re_filename.match(filename)
-        if not match:
-            raise Exception(
-                f"Cannot parse filename '{filename}' as a valid challenge part "
-                f"filename")
+        >>> DefaultBoilerplate().extract_from_filename(
+        ...     'year_2020/day_15/part_a_py')
+        Traceback (most recent call last):
+        ...
+        Exception: ...
+        >>> DefaultBoilerplate().extract_from_filename(
+        ...     'year_2020/day_15/part_a.py\\n')
+        Traceback (most recent call last):
+        ...
+        Exception: ...
 
-        year_str, day_str, part = match.groups()
-        year = int(year_str)
-        day = int(day_str)
+        Subclasses can override the pattern:
 
-        return year, day, part
+        >>> class FlatBoilerplate(DefaultBoilerplate):
+        ...     re_filename = re.compile(r"^(?:.*/)?(\\d+)_(\\d+)_([ab])\\.py$")
+        >>> FlatBoilerplate().extract_from_filename('aoc/2020_15_b.py')
+        (2020, 15, 'b')
+        >>> FlatBoilerplate().extract_from_filename(
+        ...     'year_2020/day_15/part_b.py')
+        Traceback (most recent call last):
+        ...
+        Exception: ...
+        """
+        return parse_part_filename(filename, self.re_filename)
 
     def get_part_filename(self, year: int, day: int, part: str,
                           relative: bool = False):
@@ -73,10 +186,10 @@ class DefaultBoilerplate(BaseBoilerplate):
         >>> str(DefaultBoilerplate().get_part_filename(2020, 15, 'a', True))
         'year_2020/day_15/part_a.py'
         """
-        day_directory = self.get_day_directory(year, day, relative=relative)
-        if day_directory is None:
+        base = self.get_base_directory(relative=relative)
+        if base is None:
             return None
-        return day_directory.joinpath(f"part_{part}.py")
+        return get_day_file_path(base, year, day, f"part_{part}.py")
 
     def get_day_input_filename(self, year: int, day: int,
                                relative: bool = False):
@@ -86,10 +199,10 @@ class DefaultBoilerplate(BaseBoilerplate):
         >>> str(DefaultBoilerplate().get_day_input_filename(2020, 15, True))
         'year_2020/day_15/input.txt'
         """
-        day_directory = self.get_day_directory(year, day, relative=relative)
-        if day_directory is None:
+        base = self.get_base_directory(relative=relative)
+        if base is None:
             return None
-        return day_directory.joinpath("input.txt")
+        return get_day_file_path(base, year, day, "input.txt")
 
     def get_day_directory(self, year: int, day: int, relative: bool = False):
         """
@@ -98,23 +211,29 @@ class DefaultBoilerplate(BaseBoilerplate):
         >>> str(DefaultBoilerplate().get_day_directory(2020, 15, True))
         'year_2020/day_15'
         """
-        year_directory = self.get_year_directory(year, relative=relative)
-        if year_directory is None:
+        base = self.get_base_directory(relative=relative)
+        if base is None:
             return None
-        return year_directory.joinpath(f"day_{day:0>2}")
+        return get_day_path(base, year, day)
 
     def get_year_directory(self, year: int, relative: bool = False):
         """
         >>> str(DefaultBoilerplate().get_year_directory(2020, True))
         'year_2020'
         """
-        if relative:
-            base = Path()
-        else:
-            base = settings_proxy().challenges_root
+        base = self.get_base_directory(relative=relative)
         if base is None:
             return None
-        return base.joinpath(f"year_{year}")
+        return get_year_path(base, year)
+
+    def get_base_directory(self, relative: bool = False):
+        """
+        >>> str(DefaultBoilerplate().get_base_directory(True))
+        '.'
+        """
+        if relative:
+            return Path()
+        return settings_proxy().challenges_root
 
     def get_part_module_name(self, year, day, part):
         """
@@ -123,10 +242,8 @@ class DefaultBoilerplate(BaseBoilerplate):
         >>> DefaultBoilerplate().get_part_module_name(2020, 15, 'a')
         'year_2020.day_15.part_a'
         """
-        return ".".join(filter(None, [
-            settings_proxy().challenges_module_name_root,
-            f"year_{year}.day_{day:0>2}.part_{part}",
-        ]))
+        return get_module_name(
+            settings_proxy().challenges_module_name_root, year, day, part)
 
     def create_part(self, year, day, part):
         """Add challenge code boilerplate, if it's not already there"""
@@ -144,21 +261,17 @@ class DefaultBoilerplate(BaseBoilerplate):
                 f"exists at {e_value(str(part_path))}")
             return False
 
-        year_init_path = year_path.joinpath("__init__.py")
-        if not year_init_path.exists():
-            year_init_path.parent.mkdir(exist_ok=True)
-            year_init_path.touch()
-        day_init_path = day_path.joinpath("__init__.py")
-        if not day_init_path.exists():
-            day_init_path.parent.mkdir(exist_ok=True)
-            day_init_path.touch()
+        day_init_path = os.path.join(day_path, "__init__.py")
+        is_new_day = not os.path.exists(day_init_path)
+        os.makedirs(day_path, exist_ok=True)
+        # Opening for appending only creates the files if they're missing
+        for path in (os.path.join(year_path, "__init__.py"), day_init_path,
+                     os.path.join(day_path, "input.txt")):
+            open(path, 'a').close()
+        if is_new_day:
             part_a_path = self.get_part_filename(year, day, 'a')
             shutil.copy(self.example_part_path, part_a_path)
-        day_input_path = day_path.joinpath("input.txt")
-        if not day_input_path.exists():
-            day_input_path.parent.mkdir(exist_ok=True)
-            day_input_path.touch()
-        if not part_path.exists():
+        if not os.path.exists(part_path):
             shutil.copy(self.example_part_path, part_path)
 
         return True
@@ -3,11 +3,11 @@ A class that provides an interface, and some boilerplate, for every challenge.
 """
 
 import doctest
-import importlib
+import functools
 import sys
 
 from aox.settings import settings_proxy
-from aox.utils import has_method_arguments
+from aox.utils import has_method_arguments, cached_property
 
 
 __all__ = ['PlayNotImplementedError', 'BaseChallenge']
@@ -17,6 +17,16 @@ class PlayNotImplementedError(NotImplementedError):
     pass
 
 
+@functools.lru_cache(maxsize=128)
+def read_input_file(path: str, modified_time_ns: int, size: int) -> str:
+    """
+    Read an input file. The modification time and size are part of the cache
+    key, so that an input refreshed during the run is read again.
+    """
+    with open(path) as f:
+        return f.read()
+
+
 class BaseChallenge:
     """
     The base class for every challenge.
@@ -27,16 +37,29 @@ class BaseChallenge:
     """
     part_a_for_testing = None
     optionflags = doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE
+    class_module = None
+    """The module the challenge class was defined in, resolved once"""
+    main_args_prefix = None
+    """The CLI arguments to invoke this challenge, before any extra ones"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.class_module = sys.modules.get(cls.__module__)
+        if getattr(cls.class_module, '__file__', None):
+            cls.main_args_prefix = cls.get_main_args_prefix()
+        else:
+            cls.main_args_prefix = None
 
     def __init__(self):
         self.module = self.get_module()
         self.year, self.day, self.part = settings_proxy()\
             .challenges_boilerplate\
             .extract_from_filename(self.module.__file__)
-        self.input = self.get_input()
 
     @classmethod
     def get_module(cls):
+        if cls.class_module is not None:
+            return cls.class_module
         return sys.modules[cls.__module__]
 
     @classmethod
@@ -44,11 +67,33 @@ class BaseChallenge:
         main_module = sys.modules.get('__main__')
         return cls.get_module() == main_module
 
+    @cached_property
+    def input(self):
+        """
+        The input for the challenge, only read when it's first needed, so that
+        eg only running the tests doesn't need it
+        """
+        return self.get_input()
+
+    @cached_property
+    def parsed_input(self):
+        """
+        The input as returned by `parse_input`, only parsed once, so that
+        solutions and tests that need it repeatedly share the same result
+        """
+        return self.parse_input(self.input)
+
+    def parse_input(self, _input):
+        """Parse the input into a structure. By default it's returned as is"""
+        return _input
+
     def get_input(self):
         """Get the input for the challenge"""
-        return settings_proxy().challenges_boilerplate\
-            .get_day_input_filename(self.year, self.day)\
-            .read_text()
+        input_path = settings_proxy().challenges_boilerplate\
+            .get_day_input_filename(self.year, self.day)
+        input_stat = input_path.stat()
+        return read_input_file(
+            str(input_path), input_stat.st_mtime_ns, input_stat.st_size)
 
     @classmethod
     def main(cls, extra_args=None):
@@ -66,13 +111,21 @@ class BaseChallenge:
         """The CLI arguments to simulate an invocation of this challenge"""
         if extra_args is None:
             extra_args = sys.argv[1:]
-        return [
+        main_args_prefix = cls.main_args_prefix
+        if main_args_prefix is None:
+            main_args_prefix = cls.get_main_args_prefix()
+        return [*main_args_prefix, *extra_args]
+
+    @classmethod
+    def get_main_args_prefix(cls):
+        """The CLI arguments to invoke this challenge, before any extra ones"""
+        return (
             'challenge',
             '--path', cls.get_module().__file__,
             '0',
             '0',
             'a',
-        ] + extra_args
+        )
 
     # noinspection PyUnusedLocal
     def default_solve(self, _input=None, debugger=None):
@@ -81,7 +134,7 @@ class BaseChallenge:
             _input = self.input
         if debugger is None:
             from aox.challenge import Debugger
-            debugger = Debugger(enabled=False)
+            debugger = Debugger.disabled()
         if has_method_arguments(self.solve, "debugger"):
             return self.solve(_input, debugger=debugger)
         else:
@@ -111,7 +164,7 @@ class BaseChallenge:
         any other utility functionality not inside either part.
         """
         modules = [
-            importlib.import_module(type(self).__module__),
+            self.get_module(),
         ]
         if self.part_a_for_testing:
             modules.append(self.part_a_for_testing)
@@ -3,15 +3,37 @@ from dataclasses import dataclass, field
 from typing import Optional, TypeVar, Iterable, Callable, List
 
 from aox.settings import settings_proxy
-from aox.utils import Timer, pretty_duration
+from aox.utils import Timer, pretty_duration, add_slots
 from aox.utils import DummyTimer  # noqa: F401
 
-__all__ = ['Debugger']
+__all__ = ['Debugger', 'NullDebugger', 'DebuggerSnapshot']
 
 T = TypeVar('T')
 ReportFormat = Callable[['Debugger', str], str]
 
 
+@dataclass(frozen=True)
+class DebuggerSnapshot:
+    """
+    The stats of a debugger at a single point in time, so that a report format
+    can use several of them while reading the clock only once
+    """
+    step_count: int
+    """How many steps have elapsed"""
+    duration_since_start: float
+    """How much time has passed since the start"""
+    step_frequency: float
+    """How many steps/second have we performed since the beginning"""
+    step_frequency_since_last_report: float
+    """How many steps/second have we performed since the last report"""
+
+    @property
+    def pretty_duration_since_start(self) -> str:
+        """A pretty rendition of time passed since the start"""
+        return pretty_duration(self.duration_since_start, 0)
+
+
+@add_slots
 @dataclass
 class Debugger:
     """
@@ -35,6 +57,40 @@ class Debugger:
     """The indent for reporting. Creating a sub-debugger should indent output"""
     indent_increase: str = "  "
     """By how much to increment debugging"""
+    time_check_stride: int = field(default=1, repr=False)
+    """
+    Only check the time every that many steps since the last report, so that
+    calling `report_if` on every step doesn't read the clock every time. The
+    report latency is then also bounded by that many steps.
+    """
+    next_time_check_step_count: int = field(
+        default=0, init=False, repr=False, compare=False)
+    """
+    After how many steps since the last report to check the time again, when
+    checking only every `time_check_stride` steps
+    """
+
+    def __post_init__(self):
+        """
+        >>> Debugger(time_check_stride=0)
+        Traceback (most recent call last):
+        ...
+        ValueError: The time check stride must be at least 1, not 0
+        """
+        if self.time_check_stride < 1:
+            raise ValueError(
+                f"The time check stride must be at least 1, not "
+                f"{self.time_check_stride}")
+
+    @classmethod
+    def disabled(cls) -> 'NullDebugger':
+        """
+        A debugger that keeps count of the steps, but never reports
+
+        >>> Debugger.disabled()
+        NullDebugger(...enabled=False...)
+        """
+        return NullDebugger()
 
     def __enter__(self):
         self.reset()
@@ -79,6 +135,7 @@ class Debugger:
         self.step_count = 0
         self.step_count_since_last_report = 0
         self.last_report_time = None
+        self.next_time_check_step_count = 0
 
         return self
 
@@ -92,6 +149,7 @@ class Debugger:
         return cls(
             enabled=self.enabled,
             min_report_interval_seconds=self.min_report_interval_seconds,
+            time_check_stride=self.time_check_stride,
             indent=self.indent + self.indent_increase,
             indent_increase=self.indent_increase,
         )
@@ -155,7 +213,9 @@ class Debugger:
         >>> debugger.step_frequency
         1.5
         """
-        return self.step_count / self.duration_since_start
+        # Computed directly, as this is usually called by report formats
+        timer = self.timer
+        return self.step_count / (timer.get_current_time() - timer.start)
 
     @property
     def step_frequency_since_last_report(self) -> float:
@@ -175,10 +235,44 @@ class Debugger:
         >>> debugger.step_frequency_since_last_report
         3.0
         """
-        duration = self.duration_since_last_report
-        if duration is None:
-            duration = self.duration_since_start
-        return self.step_count_since_last_report / duration
+        timer = self.timer
+        last_report_time = self.last_report_time
+        if last_report_time is None:
+            last_report_time = timer.start
+        return (
+            self.step_count_since_last_report
+            / (timer.get_current_time() - last_report_time)
+        )
+
+    def snapshot(self) -> DebuggerSnapshot:
+        """
+        Get the current stats, reading the clock only once
+
+        >>> debugger = Debugger(timer=Timer(default_timer=DummyTimer()))
+        >>> debugger.step().step().step().snapshot()
+        DebuggerSnapshot(step_count=3, duration_since_start=1,
+            step_frequency=3.0, step_frequency_since_last_report=3.0)
+        >>> debugger.report().step().snapshot()
+        DebuggerSnapshot(step_count=4, duration_since_start=3,
+            step_frequency=1.33..., step_frequency_since_last_report=1.0)
+        >>> debugger.snapshot().pretty_duration_since_start
+        '4s'
+        """
+        timer = self.timer
+        now = timer.get_current_time()
+        duration_since_start = now - timer.start
+        last_report_time = self.last_report_time
+        if last_report_time is None:
+            last_report_time = timer.start
+        return DebuggerSnapshot(
+            step_count=self.step_count,
+            duration_since_start=duration_since_start,
+            step_frequency=self.step_count / duration_since_start,
+            step_frequency_since_last_report=(
+                self.step_count_since_last_report
+                / (now - last_report_time)
+            ),
+        )
 
     def should_report(self) -> bool:
         """
@@ -207,23 +301,69 @@ class Debugger:
         [False, False, False, False]
         >>> debugger.should_report()
         True
+        >>> debugger = Debugger(
+        ...     timer=Timer(default_timer=DummyTimer()),
+        ...     min_report_interval_seconds=0, time_check_stride=4)
+        >>> debugger.report().step().should_report()
+        False
+        >>> debugger.timer.default_timer
+        DT(2, 1)
+        >>> debugger.step(3).should_report()
+        True
+
+        Stepping by more than one at a time still checks the time once enough
+        steps have passed:
+
+        >>> debugger = Debugger(
+        ...     timer=Timer(default_timer=DummyTimer()),
+        ...     min_report_interval_seconds=0, time_check_stride=4)
+        >>> debugger.report().step(3).should_report()
+        False
+        >>> debugger.step(3).should_report()
+        True
+        >>> debugger.step(3).should_report()
+        False
+        >>> debugger.step(3).should_report()
+        True
         """
+        time_check_stride = self.time_check_stride
+        # With a stride of 1 the time is checked on every call, even without
+        # stepping in between
+        if time_check_stride > 1:
+            step_count_since_last_report = self.step_count_since_last_report
+            if step_count_since_last_report < self.next_time_check_step_count:
+                return False
+            self.next_time_check_step_count = \
+                step_count_since_last_report + time_check_stride
         if not self.should_report_after_time():
             return False
         return True
 
     def should_report_after_time(self) -> bool:
         """Has enough time passed since the last attempt?"""
-        duration_since_last_report = self.duration_since_last_report
-        if duration_since_last_report is None:
+        last_report_time = self.last_report_time
+        if last_report_time is None:
             return True
+        # Call the clock directly, as this is checked in solutions' inner loops
         return (
-            duration_since_last_report
+            self.timer.default_timer() - last_report_time
             >= self.min_report_interval_seconds
         )
 
     def step(self, step_count: int = 1) -> 'Debugger':
-        """Advance the step counter"""
+        """
+        Advance the step counter. In a tight loop, it's cheaper to process
+        items in batches, and step once for each batch:
+
+        >>> debugger = Debugger()
+        >>> items = list(range(10))
+        >>> for start in range(0, len(items), 4):
+        ...     batch = items[start:start + 4]
+        ...     _ = sum(batch)
+        ...     _ = debugger.step(len(batch)).report_if()
+        >>> debugger.step_count
+        10
+        """
         self.step_count += step_count
         self.step_count_since_last_report += step_count
 
@@ -245,8 +385,11 @@ class Debugger:
         >>> debugger.step_count
         3
         """
+        # Increment the counters in place, instead of calling `step` for every
+        # item, as this is usually in a solution's innermost loop
         for item in items:
-            self.step()
+            self.step_count += 1
+            self.step_count_since_last_report += 1
             yield item
 
     def step_if(self, value: T) -> T:
@@ -268,7 +411,8 @@ class Debugger:
         3
         """
         if value:
-            self.step()
+            self.step_count += 1
+            self.step_count_since_last_report += 1
         return value
 
     @contextmanager
@@ -282,7 +426,8 @@ class Debugger:
 
     def report(self, *args, **kwargs) -> 'Debugger':
         """
-        Output a message
+        Output a message, and start counting the time and steps since the last
+        report again. A disabled debugger does neither.
 
         >>> Debugger().report()
         Debugger(...)
@@ -302,13 +447,21 @@ class Debugger:
         ??a message
         Debugger(...)
         """
-        if self.enabled and args:
-            if self.indent not in (None, ""):
-                print(self.indent, end="")
-            print(*args, **kwargs)
+        if not self.enabled:
+            # A disabled debugger doesn't keep track of reports either, so that
+            # every way of reporting leaves it the same
+            return self
+        if args:
+            if self.indent:
+                # Prepend the indent, so that it's written in a single print
+                first, *rest = args
+                print(f"{self.indent}{first}", *rest, **kwargs)
+            else:
+                print(*args, **kwargs)
 
         self.last_report_time = self.timer.get_current_time()
         self.step_count_since_last_report = 0
+        self.next_time_check_step_count = self.time_check_stride
 
         return self
 
@@ -316,14 +469,21 @@ class Debugger:
         """
         Output a message with the default format from settings.
         """
+        if not self.enabled:
+            # Don't spend time formatting a message that won't be output
+            return self
         message = self.apply_report_formats(message)
         return self.report(message, **kwargs)
 
     def apply_report_formats(self, message: str = "") -> str:
         """Apply the default, and any extra report formats, to a message"""
         report_formats = self.extra_report_formats
-        for report_format in reversed(report_formats):
-            message = report_format(self, message)
+        # Usually there's at most one extra format, so avoid the iterator
+        if len(report_formats) == 1:
+            message = report_formats[0](self, message)
+        elif report_formats:
+            for report_format in reversed(report_formats):
+                message = report_format(self, message)
 
         default_debugger_report_format = settings_proxy()\
             .default_debugger_report_format
@@ -352,7 +512,8 @@ class Debugger:
         a message
         Debugger(...)
         """
-        if not self.should_report():
+        # A disabled debugger wouldn't output anything anyway
+        if not self.enabled or not self.should_report():
             return self
         self.report(*args, **kwargs)
 
@@ -363,6 +524,45 @@ class Debugger:
         Output a message with the default format from settings, if it's
         appropriate.
         """
-        if not self.should_report():
+        if not self.enabled or not self.should_report():
             return self
         return self.default_report(message, **kwargs)
+
+
+@add_slots
+@dataclass
+class NullDebugger(Debugger):
+    """
+    A disabled debugger, where reporting does nothing, so that calling it in a
+    solution's innermost loop costs as little as possible. Like
+    `Debugger(enabled=False)`, it still keeps count of the steps.
+
+    >>> debugger = NullDebugger()
+    >>> bool(debugger)
+    False
+    >>> debugger.step().step(5).step_count
+    6
+    >>> list(debugger.stepping(range(3))), debugger.step_count
+    ([0, 1, 2], 9)
+    >>> debugger.step_if("value"), debugger.step_count
+    ('value', 10)
+    >>> debugger.report_if("a", "message") is debugger
+    True
+    >>> debugger.default_report_if("a message") is debugger
+    True
+    >>> debugger.sub_debugger()
+    NullDebugger(...enabled=False...)
+    """
+    enabled: bool = False
+
+    def report(self, *args, **kwargs) -> 'Debugger':
+        return self
+
+    def default_report(self, message: str = "", **kwargs) -> 'Debugger':
+        return self
+
+    def report_if(self, *args, **kwargs) -> 'Debugger':
+        return self
+
+    def default_report_if(self, message: str = "", **kwargs) -> 'Debugger':
+        return self
@@ -3,11 +3,13 @@ All the operations that are provided by the framework can be done via using
 `Controller`.
 """
 
-import distutils.dir_util
+import importlib
 import json
+import os
 from dataclasses import dataclass
 from doctest import TestResults
 from enum import auto
+from itertools import repeat
 from typing import Optional
 
 import click
@@ -20,12 +22,32 @@ from aox.styling.shortcuts import e_warn, e_value, e_success, e_star, e_error, \
     e_unable, e_suggest
 from aox.summary import summary_registry
 from aox.testing.doctest_enhanced_testmod import testmod_with_filter
+from aox.testing.doctest_filtering import FilteringDocTestFinder
 from aox.utils import get_current_directory, StringEnum, Timer, \
-    has_method_arguments
+    has_method_arguments, copy_tree
 
 current_directory = get_current_directory()
 
 
+def initialise_worker_settings(settings_directory):
+    """
+    Load the settings in a worker process, if it didn't inherit them, eg when
+    processes are spawned rather than forked
+    """
+    if not settings_proxy.has():
+        settings_proxy.set(Settings.from_settings_directory(settings_directory))
+
+
+def testmod_module_by_name(module_name, optionflags, filters_text):
+    """
+    Run the tests for a module by its name, so that it can be run in another
+    process
+    """
+    module = importlib.import_module(module_name)
+    return testmod_with_filter(
+        module, optionflags=optionflags, filters_text=filters_text)
+
+
 @dataclass
 class Controller:
     repo_info: Optional[RepoInfo] = None
@@ -52,9 +74,7 @@ class Controller:
         """Create a new settings directory for the user"""
         if settings_directory is None:
             settings_directory = Settings.DEFAULT_SETTINGS_DIRECTORY
-        distutils.dir_util.copy_tree(
-            Settings.EXAMPLE_SETTINGS_DIRECTORY,
-            str(settings_directory))
+        copy_tree(Settings.EXAMPLE_SETTINGS_DIRECTORY, settings_directory)
         settings = Settings.from_settings_directory(settings_directory)
         settings_proxy.set(settings)
         click.echo(
@@ -136,6 +156,10 @@ class Controller:
             with settings_proxy().site_data_path.open('w') as f:
                 json.dump(account_info.serialise(), f, indent=2)
 
+        # The cached site data are about to be replaced, so only the local
+        # code needs to be loaded, if it hasn't been already
+        if self.repo_info is None:
+            self.repo_info = RepoInfo.from_roots()
         self.update_combined_info(account_info=account_info)
         click.echo(
             f"Fetched data for {e_success(account_info.username)}: "
@@ -176,7 +200,7 @@ class Controller:
         """Refresh a challenge's input from the AOC website"""
         input_path = settings_proxy().challenges_boilerplate\
             .get_day_input_filename(year, day)
-        if only_if_empty and input_path.exists() and input_path.lstat().st_size:
+        if only_if_empty and self.get_file_size(input_path):
             return False
 
         _input = WebAoc().get_input_page(year, day)
@@ -185,7 +209,7 @@ class Controller:
                 f"Could not update input for {e_error(f'{year} {day}')}")
             return False
 
-        if input_path.exists() and _input == input_path.read_text():
+        if _input == self.read_text_if_exists(input_path):
             click.echo(
                 f"Input did not change for {e_warn(f'{year} {day}')} "
                 f"({e_value(f'{len(_input)} bytes')})")
@@ -200,6 +224,20 @@ class Controller:
 
         return True
 
+    def get_file_size(self, path):
+        """The size of a file, or `None` if it's missing, with a single stat"""
+        try:
+            return path.lstat().st_size
+        except FileNotFoundError:
+            return None
+
+    def read_text_if_exists(self, path):
+        """Read a file, or return `None` if it's missing"""
+        try:
+            return path.read_text()
+        except FileNotFoundError:
+            return None
+
     def add_challenge(self, year: int, day: int, part: str):
         """Add challenge code boilerplate, if it's not already there"""
         if not settings_proxy().challenges_boilerplate\
@@ -244,13 +282,33 @@ class Controller:
         filters_text = " ".join(filters_texts)
         test_modules = challenge_instance.get_test_modules()
         with Timer() as timer:
-            modules_and_results = [
-                (module,
-                 testmod_with_filter(
-                     module, optionflags=challenge_instance.optionflags,
-                     filters_text=filters_text))
-                for module in test_modules
-            ]
+            if len(test_modules) > 1 and settings_proxy().parallel_doctests:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(
+                        max_workers=min(len(test_modules), os.cpu_count() or 1),
+                        initializer=initialise_worker_settings,
+                        initargs=(settings_proxy().settings_directory,),
+                        ) as executor:
+                    modules_and_results = list(zip(test_modules, executor.map(
+                        testmod_module_by_name,
+                        [module.__name__ for module in test_modules],
+                        repeat(challenge_instance.optionflags),
+                        repeat(filters_text),
+                    )))
+            else:
+                # Parse the filters once, instead of once per module
+                if filters_text:
+                    finder = FilteringDocTestFinder(
+                        exclude_empty=False, filters_text=filters_text)
+                else:
+                    finder = None
+                modules_and_results = [
+                    (module,
+                     testmod_with_filter(
+                         module, optionflags=challenge_instance.optionflags,
+                         finder=finder))
+                    for module in test_modules
+                ]
         results = TestResults(
             attempted=sum(
                 result.attempted
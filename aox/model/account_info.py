@@ -4,11 +4,14 @@ Gather stars from the AOC site.
 The main entry point is `AccountInfo.from_site`
 """
 
+import functools
 import json
+import sys
 from dataclasses import dataclass, field
 from typing import Dict
 
 from aox.settings import settings_proxy
+from aox.utils import try_import_module
 from aox.web import AccountScraper
 
 __all__ = [
@@ -19,6 +22,28 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def get_json_loads():
+    """
+    The function to parse the site data with: `orjson` is much faster, but it's
+    optional, so fall back to `json` if it's not installed.
+    """
+    orjson = try_import_module('orjson')
+    if orjson is None:
+        return json.loads
+    return orjson.loads
+
+
+@functools.lru_cache(maxsize=8)
+def load_site_data(path, modified_time_ns, size):
+    """
+    Parse the cached site data. The file's modification time and size are part
+    of the cache key, so that a changed file gets parsed again. The parsed data
+    are shared, so they must not be mutated.
+    """
+    return get_json_loads()(path.read_bytes())
+
+
 @dataclass
 class AccountInfo:
     """
@@ -82,11 +107,15 @@ class AccountInfo:
     @classmethod
     def from_cache(cls):
         site_data_path = settings_proxy().site_data_path
-        if not site_data_path or not site_data_path.exists():
+        if not site_data_path:
             return None
 
-        with site_data_path.open() as f:
-            serialised = json.load(f)
+        try:
+            stat = site_data_path.stat()
+            serialised = load_site_data(
+                site_data_path, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
 
         return cls.deserialise(serialised)
 
@@ -480,7 +509,10 @@ class AccountPartInfo:
 
     @classmethod
     def deserialise(cls, serialised, version, day_info):
-        """Read the data from JSON. The data are versioned"""
+        """
+        Read the data from JSON. The data are versioned. The part is interned,
+        like the parts of local code, as it's used as a key everywhere.
+        """
         if version == 1:
             return cls.deserialise_v1(serialised, day_info)
         elif version == 2:
@@ -494,7 +526,7 @@ class AccountPartInfo:
         """Parse the years from JSON version 1"""
         return cls(
             day_info=day_info,
-            part=serialised["part"],
+            part=sys.intern(serialised["part"]),
             has_star=bool(serialised["stars"]),
         )
 
@@ -503,7 +535,7 @@ class AccountPartInfo:
         """Parse the years from JSON version 1"""
         return cls(
             day_info=day_info,
-            part=serialised["part"],
+            part=sys.intern(serialised["part"]),
             has_star=serialised["has_star"],
         )
 
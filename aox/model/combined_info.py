@@ -4,7 +4,7 @@ Combine local and site information about a user's submissions.
 The main entry point is `CombinedInfo.from_repo_and_account_infos`.
 """
 
-import itertools
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Optional
@@ -249,14 +249,11 @@ class CombinedYearInfo(object):
                 part_info.update_status()
         self.counts_by_part_status.update({
             **self.get_initial_counts_by_part_status(),
-            **{
-                part_status: len(list(items))
-                for part_status, items in itertools.groupby(sorted(
-                    part_info.status
-                    for day_info in self.day_infos.values()
-                    for part_info in day_info.part_infos.values()
-                ))
-            },
+            **Counter(
+                part_info.status
+                for day_info in self.day_infos.values()
+                for part_info in day_info.part_infos.values()
+            ),
         })
 
     @property
@@ -314,13 +311,13 @@ class CombinedDayInfo:
     def amend_parts_from_account_day_info(self, account_day_info):
         """
         Called after creating the instance, to populate the parts with remote
-        information
+        information. The statuses are updated by the year afterwards, once all
+        the days are populated.
         """
         for account_part_info in account_day_info.part_infos.values():
             if account_part_info.part in self.part_infos:
                 part_info = self.part_infos[account_part_info.part]
                 part_info.has_star = account_part_info.has_star
-                part_info.update_status()
             else:
                 # noinspection PyTypeChecker
                 part_info = CombinedPartInfo(
@@ -337,7 +334,8 @@ class CombinedDayInfo:
     def amend_parts_from_repo_day_info(self, repo_day_info):
         """
         Called after creating the instance, to populate the parts with local
-        information
+        information. The statuses are updated by the year afterwards, once all
+        the days are populated.
         """
         for repo_part_info in repo_day_info.part_infos.values():
             if repo_part_info.part in self.part_infos:
@@ -356,7 +354,6 @@ class CombinedDayInfo:
                     module_name=repo_part_info.module_name,
                 )
                 self.part_infos[repo_part_info.part] = part_info
-            part_info.update_status()
 
     @property
     def year(self):
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Dict
 
 from aox.settings import settings_proxy
-from aox.utils import Literal
+from aox.utils import Literal, ExistingFiles
 
 __all__ = ['RepoInfo', 'RepoYearInfo', 'RepoDayInfo', 'RepoPartInfo']
 
@@ -31,7 +31,9 @@ class RepoInfo:
     @classmethod
     def from_roots(cls, existing_files=None):
         """
-        Create a tree structure, by looking for the expected filenames
+        Create a tree structure, by looking for the expected filenames. If
+        they are not passed in, and the boilerplate has a base directory, it's
+        listed once, rather than checking every possible part separately.
 
         >>> RepoInfo.from_roots(existing_files=[])
         RepoInfo(has_code=False, year_infos={...})
@@ -42,6 +44,11 @@ class RepoInfo:
         ...     existing_files=[Path('year_2015/day_01/part_a.py')])
         RepoInfo(has_code=True, year_infos={...})
         """
+        if existing_files is None:
+            base_directory = settings_proxy().challenges_boilerplate\
+                .get_base_directory()
+            if base_directory is not None:
+                existing_files = ExistingFiles(base_directory)
         repo_info = cls(has_code=False)
         repo_info.fill(existing_files)
         return repo_info
@@ -163,10 +170,10 @@ class RepoPartInfo:
 
     @classmethod
     def from_part(cls, part, day_info, existing_files=None):
-        path = settings_proxy().challenges_boilerplate\
-            .get_part_filename(day_info.year, day_info.day, part)
-        module_name = settings_proxy().challenges_boilerplate\
-            .get_part_module_name(day_info.year, day_info.day, part)
+        boilerplate = settings_proxy().challenges_boilerplate
+        year, day = day_info.year, day_info.day
+        path = boilerplate.get_part_filename(year, day, part)
+        module_name = boilerplate.get_part_module_name(year, day, part)
         if existing_files is None:
             has_code = path.exists()
         else:
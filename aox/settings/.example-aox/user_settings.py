@@ -47,6 +47,14 @@ stars you have, and also which challenges have you completed.
 This needs to be a `Path` instance.
 """
 
+HTTP_CACHE_PATH = dot_aox.joinpath('http_cache.json')
+"""
+The path for the cached pages from the AOC site, so that they're only
+downloaded again if they changed. Set it to `None` to always download them.
+
+This needs to be a `Path` instance.
+"""
+
 README_PATH = repo_root.joinpath('README.md')
 """
 The path for your README file, so that it can update the stats.
@@ -61,15 +69,23 @@ Also import these extra modules, eg if you specify custom summaries.
 It needs to be a list of strings that are valid module names.
 """
 
+PARALLEL_DOCTESTS = False
+"""
+Whether to run a challenge's test modules (eg with `part_a_for_testing`) in
+parallel, in separate processes. Each process loads the settings from this
+directory again.
+"""
+
 
 def verbose_debugger_format(debugger: 'Debugger', message: str) -> str:
     from aox.utils import add_thousands_separator
 
+    snapshot = debugger.snapshot()
     return (
-        f"Step: {add_thousands_separator(debugger.step_count)}, {message}, "
-        f"time: {debugger.pretty_duration_since_start}, total steps/s: "
-        f"{debugger.step_frequency}, recent steps/s: "
-        f"{debugger.step_frequency_since_last_report}"
+        f"Step: {add_thousands_separator(snapshot.step_count)}, {message}, "
+        f"time: {snapshot.pretty_duration_since_start}, total steps/s: "
+        f"{snapshot.step_frequency}, recent steps/s: "
+        f"{snapshot.step_frequency_since_last_report}"
     )
 
 
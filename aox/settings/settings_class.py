@@ -70,6 +70,12 @@ class Settings:
             "warn": warnings.warn_falsy_attribute,
         },
     )
+    http_cache_path: Optional[Path] = field(
+        default=None,
+        metadata={
+            "module_attribute": "HTTP_CACHE_PATH",
+        },
+    )
     readme_path: Optional[Path] = field(
         default=Path().joinpath('README.md'),
         metadata={
@@ -91,6 +97,12 @@ class Settings:
                 "warn": warnings.warn_falsy_attribute,
             },
         )
+    parallel_doctests: bool = field(
+        default=False,
+        metadata={
+            "module_attribute": "PARALLEL_DOCTESTS",
+        },
+    )
     _warnings: Dict[str, Any] = field(
         default_factory=warnings.get_warnings_for_new_instance)
 
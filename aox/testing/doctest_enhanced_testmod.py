@@ -3,9 +3,13 @@ Since :mod:`doctest` doesn't allow filtering tests, this provides that
 functionality to allow you to select which tests do you want to run.
 """
 
+import copy
 import doctest
+import functools
+import os
 import sys
-from typing import Type
+from doctest import DocTest
+from typing import Type, Tuple
 
 from aox.testing.doctest_filter_parsing import DocTestFilterParser, \
     IndexedDocTestFilterParser
@@ -66,15 +70,19 @@ def testmod_with_finder(
         name = m.__name__
 
     # Find, parse, and run all tests in the given module.
-    if finder is None:
-        finder = doctest.DocTestFinder(exclude_empty=exclude_empty)
+    if finder is None and globs is None and extraglobs is None:
+        tests = find_module_tests(m, name, exclude_empty)
+    else:
+        if finder is None:
+            finder = doctest.DocTestFinder(exclude_empty=exclude_empty)
+        tests = finder.find(m, name, globs=globs, extraglobs=extraglobs)
 
     if raise_on_error:
         runner = doctest.DebugRunner(verbose=verbose, optionflags=optionflags)
     else:
         runner = doctest.DocTestRunner(verbose=verbose, optionflags=optionflags)
 
-    for test in finder.find(m, name, globs=globs, extraglobs=extraglobs):
+    for test in tests:
         runner.run(test)
 
     if report:
@@ -86,3 +94,34 @@ def testmod_with_finder(
         doctest.master.merge(runner)
 
     return doctest.TestResults(runner.failures, runner.tries)
+
+
+def find_module_tests(m, name, exclude_empty=False):
+    """
+    Find the tests in a module, reusing the parsed tests as long as the
+    module's file hasn't changed. Running a test clears its globals, so each
+    call gets copies of the tests with fresh ones.
+    """
+    path = getattr(m, '__file__', None)
+    if path is None:
+        return doctest.DocTestFinder(exclude_empty=exclude_empty).find(m, name)
+    stat = os.stat(path)
+    tests = find_module_tests_for_file(
+        m, name, exclude_empty, stat.st_mtime_ns, stat.st_size)
+    fresh_tests = []
+    for test in tests:
+        test = copy.copy(test)
+        test.globs = m.__dict__.copy()
+        fresh_tests.append(test)
+    return fresh_tests
+
+
+@functools.lru_cache(maxsize=128)
+def find_module_tests_for_file(m, name, exclude_empty, modified_time_ns, size
+                               ) -> Tuple[DocTest, ...]:
+    """
+    Parse the tests of a module. The file's modification time and size are
+    part of the cache key, so that a changed file gets parsed again.
+    """
+    return tuple(
+        doctest.DocTestFinder(exclude_empty=exclude_empty).find(m, name))
@@ -181,6 +181,8 @@ class IndexedDocTestFilterParser(DocTestFilterParser):
     * method:-5
     * method:-3,5-10,15-
     """
+    re_wildcards = re.compile(r'\*+')
+
     def parse_filter(self, filter_text: str) -> DocTestFilter:
         test_name_text, line_numbers_text = self.get_filter_parts(filter_text)
         return IndexedDocTestFilter(
@@ -278,7 +280,7 @@ class IndexedDocTestFilterParser(DocTestFilterParser):
         if not test_name_text.replace("*", ""):
             raise InvalidTestFilterException(
                 f"You need to specify at least some part of the test name")
-        parts = re.split(r'\*+', '*' + test_name_text)
+        parts = self.re_wildcards.split('*' + test_name_text)
         escaped_parts = map(re.escape, parts)
         return re.compile(f"{'.*'.join(escaped_parts)}$")
 
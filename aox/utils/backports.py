@@ -1,6 +1,10 @@
+import dataclasses
+import functools
+import os
+import shutil
 import sys
 
-__all__ = ['Literal']
+__all__ = ['Literal', 'cached_property', 'add_slots', 'copy_tree']
 
 
 if sys.version_info >= (3, 8):
@@ -9,3 +13,106 @@ else:
     from typing import Any
     from collections import defaultdict
     Literal = defaultdict(lambda: Any)
+
+
+if sys.version_info >= (3, 8):
+    from functools import cached_property
+else:
+    class cached_property:
+        """
+        A minimal version of `functools.cached_property`: compute the value on
+        first access, and store it on the instance
+        """
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            instance.__dict__[self.attrname] = value
+            return value
+
+
+if sys.version_info >= (3, 8):
+    def copy_tree(source, destination):
+        """Copy a directory, merging it into the destination if it exists"""
+        shutil.copytree(source, destination, dirs_exist_ok=True)
+else:
+    def copy_tree(source, destination):
+        """
+        Copy a directory, merging it into the destination if it exists, since
+        `shutil.copytree` only accepts `dirs_exist_ok` after Python 3.8
+        """
+        for directory, _, file_names in os.walk(source):
+            destination_directory = os.path.join(
+                destination, os.path.relpath(directory, source))
+            os.makedirs(destination_directory, exist_ok=True)
+            for file_name in file_names:
+                shutil.copy2(
+                    os.path.join(directory, file_name),
+                    os.path.join(destination_directory, file_name))
+
+
+def add_slots(cls):
+    """
+    Re-create a dataclass with `__slots__` for its fields, like
+    `dataclass(slots=True)` does since Python 3.10. It should be applied on top
+    of `@dataclass`.
+
+    >>> @add_slots
+    ... @dataclasses.dataclass
+    ... class Point:
+    ...     x: int = 0
+    ...     y: int = 0
+    ...     z: int = dataclasses.field(default=0, init=False)
+    >>> Point.__slots__
+    ('x', 'y', 'z')
+    >>> Point(y=2)
+    Point(x=0, y=2, z=0)
+    >>> Point().w = 3
+    Traceback (most recent call last):
+    ...
+    AttributeError: 'Point' object has no attribute 'w'...
+    """
+    inherited_slots = {
+        name
+        for base in cls.__mro__[1:]
+        for name in getattr(base, '__slots__', ())
+    }
+    field_names = tuple(
+        field.name
+        for field in dataclasses.fields(cls)
+        if field.name not in inherited_slots
+    )
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for field in dataclasses.fields(cls):
+        # The defaults are class attributes, that would clash with the slots,
+        # including any inherited ones
+        cls_dict.pop(field.name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    # `__init__` doesn't set fields with defaults that are excluded from it, as
+    # it expects to read them from the class attributes
+    init_excluded_defaults = {
+        field.name: field.default
+        for field in dataclasses.fields(cls)
+        if not field.init and field.default is not dataclasses.MISSING
+    }
+    if init_excluded_defaults:
+        original_init = cls_dict['__init__']
+
+        @functools.wraps(original_init)
+        def __init__(self, *args, **kwargs):
+            for name, default in init_excluded_defaults.items():
+                object.__setattr__(self, name, default)
+            original_init(self, *args, **kwargs)
+
+        cls_dict['__init__'] = __init__
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    return slotted_cls
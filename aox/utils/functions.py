@@ -1,9 +1,8 @@
+import sys
 from typing import Callable, Tuple
 
 __all__ = ['get_method_arguments', 'has_method_arguments']
 
-from unittest.mock import NonCallableMock
-
 
 def get_method_arguments(method: Callable) -> Tuple[str, ...]:
     """
@@ -20,7 +19,10 @@ def get_method_arguments(method: Callable) -> Tuple[str, ...]:
     >>> get_method_arguments(function)
     ('a', 'b')
     """
-    if isinstance(method, NonCallableMock):
+    # Importing `unittest.mock` is slow, and there can't be any mocks if it
+    # hasn't been imported already
+    mock_module = sys.modules.get('unittest.mock')
+    if mock_module and isinstance(method, mock_module.NonCallableMock):
         return ()
     # noinspection PyUnresolvedReferences
     method_code = method.__code__
@@ -1,12 +1,16 @@
+import functools
 import inspect
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, FrozenSet, Optional
 
 
 __all__ = [
     'get_caller_file_name',
     'get_root_directory',
     'get_current_directory',
+    'ExistingFiles',
 ]
 
 
@@ -25,8 +29,11 @@ def get_caller_file_name(skip_frames=1):
     >>> example_caller()
     '.../utils/paths.py'
     """
-    caller = inspect.stack()[1 + skip_frames]
-    caller_frame, *_ = caller
+    # Walk the frames directly: `inspect.stack()` would also read the source
+    # context of every frame in the stack, which is slow at import time
+    caller_frame = inspect.currentframe()
+    for _ in range(1 + skip_frames):
+        caller_frame = caller_frame.f_back
     caller_globals = caller_frame.f_globals
     module_file_name = caller_globals.get('__file__', None)
 
@@ -67,4 +74,73 @@ def get_current_directory(module_file_name=None):
                 f"Could not get the file name of the calling module "
                 f"automatically - call with `__file__` as the only parameter, "
                 f"or specify the file name explicitly.")
-    return Path(os.path.dirname(os.path.realpath(module_file_name)))
+    return get_file_directory(module_file_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_file_directory(file_name):
+    """
+    Get the resolved directory of a file. Module files don't move while
+    running, so this is cached to avoid resolving symlinks again.
+
+    >>> str(get_file_directory(__file__))
+    '.../utils'
+    """
+    return Path(os.path.dirname(os.path.realpath(file_name)))
+
+
+@dataclass
+class ExistingFiles:
+    """
+    A snapshot of which files exist under a root directory, so that checking
+    many paths (eg all the possible challenge parts) doesn't need a `stat` for
+    each of them. Each directory is only listed once, when it's first needed,
+    and directories that are missing from their parent's listing are not
+    listed at all.
+
+    It can be used instead of a collection of paths, with `path in files`.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as _root:
+    ...     Path(_root).joinpath('year_2020/day_05').mkdir(parents=True)
+    ...     Path(_root).joinpath('year_2020/day_05/part_a.py').touch()
+    ...     files = ExistingFiles(Path(_root))
+    ...     (
+    ...         Path(_root).joinpath('year_2020/day_05/part_a.py') in files,
+    ...         Path(_root).joinpath('year_2020/day_05/part_b.py') in files,
+    ...         Path(_root).joinpath('year_2019/day_05/part_a.py') in files,
+    ...         sorted(
+    ...             str(directory.relative_to(_root))
+    ...             for directory, names in files.names_by_directory.items()
+    ...             if names is not None
+    ...         ),
+    ...     )
+    (True, False, False, ['.', 'year_2020', 'year_2020/day_05'])
+    """
+    root: Path
+    names_by_directory: Dict[Path, Optional[FrozenSet[str]]] = field(
+        default_factory=dict, repr=False)
+
+    def __contains__(self, path) -> bool:
+        path = Path(path)
+        names = self.get_names(path.parent)
+        return names is not None and path.name in names
+
+    def get_names(self, directory: Path) -> Optional[FrozenSet[str]]:
+        """The names in a directory, or `None` if it doesn't exist"""
+        if directory in self.names_by_directory:
+            return self.names_by_directory[directory]
+        if directory != self.root and self.root in directory.parents \
+                and directory not in self:
+            names = None
+        else:
+            names = self.list_directory(directory)
+        self.names_by_directory[directory] = names
+        return names
+
+    def list_directory(self, directory: Path) -> Optional[FrozenSet[str]]:
+        try:
+            with os.scandir(directory) as entries:
+                return frozenset(entry.name for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
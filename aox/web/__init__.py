@@ -1,2 +1,3 @@
 from .account import *  # noqa: F401, F403
 from .aoc import *  # noqa: F401, F403
+from .http_cache import *  # noqa: F401, F403
@@ -1,10 +1,11 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import click
 
 from aox.styling.shortcuts import e_error
-from aox.web.aoc import WebAoc
+from aox.web.aoc import WebAoc, MAX_CONCURRENT_REQUESTS
 
 
 __all__ = ['AccountScraper']
@@ -15,6 +16,13 @@ class AccountScraper:
     web_aoc: WebAoc = field(default_factory=WebAoc)
 
     def collect_data(self):
+        try:
+            return self.collect_data_from_site()
+        finally:
+            # Write the pages that were fetched all at once
+            self.web_aoc.save_http_cache()
+
+    def collect_data_from_site(self):
         events_page = self.web_aoc.get_events_page()
         if not events_page:
             return None
@@ -31,13 +39,28 @@ class AccountScraper:
             "years": {},
         }
 
-        for year, stars in self.get_years_stars(events_page).items():
-            year_data = self.collect_year(year, stars)
+        years_stars = self.get_years_stars(events_page)
+        for year, year_data in zip(years_stars, self.collect_years(years_stars)):
             if year_data is None:
                 continue
             collected_data["years"][year] = year_data
         return collected_data
 
+    def collect_years(self, years_stars):
+        """
+        Collect the data for each year, in the same order. The year pages are
+        fetched concurrently, since each one is a separate request to the site.
+        """
+        if len(years_stars) <= 1:
+            return [
+                self.collect_year(year, stars)
+                for year, stars in years_stars.items()
+            ]
+        with ThreadPoolExecutor(max_workers=min(
+                len(years_stars), MAX_CONCURRENT_REQUESTS)) as executor:
+            return list(executor.map(
+                self.collect_year, years_stars, years_stars.values()))
+
     def get_username(self, events_page):
         """
         Extract the username. If there isn't a username, there is no information
@@ -1,15 +1,56 @@
+import functools
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-import bs4
 import click
-import requests
 
 from aox.settings import settings_proxy
 from aox.styling.shortcuts import e_error
+from aox.web.http_cache import get_http_cache
+if TYPE_CHECKING:
+    import requests
 
 
-__all__ = ['WebAoc']
+__all__ = ['WebAoc', 'get_shared_session', 'MAX_CONCURRENT_REQUESTS']
+
+
+MAX_CONCURRENT_REQUESTS = 8
+"""
+How many requests can be made to the AOC site at the same time, eg when
+fetching the pages for all the years. The session keeps as many connections.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def get_html_parser_name() -> str:
+    """
+    The parser to use for the site's HTML: `lxml` is much faster, but it's
+    optional, so fall back to the built-in parser if it's not installed.
+    """
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_session() -> 'requests.Session':
+    """
+    The session that all requests to the AOC site go through. It's only created
+    on first use, and then shared, so that the connection to the site (and the
+    TLS handshake) is reused, instead of being repeated for every request.
+
+    >>> get_shared_session() is get_shared_session()
+    True
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+    session.mount('https://', adapter)
+    return session
 
 
 @dataclass
@@ -85,8 +126,11 @@ class WebAoc:
 
     def get_input_page(self, year, day):
         """Get the input for a particular day"""
-        return self.get_text(
-            self.get_input_url(year, day), f"year {year} day {day} input")
+        try:
+            return self.get_text(
+                self.get_input_url(year, day), f"year {year} day {day} input")
+        finally:
+            self.save_http_cache()
 
     def submit_solution(self, year, day, part, solution):
         """Post a solution"""
@@ -108,13 +152,48 @@ class WebAoc:
             url=url, parse_type='text', parse_name=parse_name,
             *args, **kwargs)
 
+    def get_session(self) -> 'requests.Session':
+        """
+        The session to make requests with. The headers and cookies are still
+        passed on each request, so different instances can share it.
+
+        >>> WebAoc('test-session').get_session() \\
+        ...     is WebAoc('other-session').get_session()
+        True
+        """
+        return get_shared_session()
+
+    def get_http_cache(self):
+        """The cache for GET requests, if the settings specify a path"""
+        settings = settings_proxy(raise_if_missing=False)
+        if settings is None or not settings.http_cache_path:
+            return None
+        return get_http_cache(settings.http_cache_path)
+
+    def save_http_cache(self):
+        """
+        Write any newly cached pages to the disk, once a batch of pages has
+        been fetched
+        """
+        http_cache = self.get_http_cache()
+        if http_cache is None:
+            return
+        http_cache.save()
+
+    def cached_get(self, url, *args, **kwargs):
+        """Get a page, going through the HTTP cache if there is one"""
+        http_cache = self.get_http_cache()
+        if http_cache is None:
+            return self.get_session().get(url, *args, **kwargs)
+        return http_cache.get(self.get_session(), url, *args, **kwargs)
+
     def get(self, *args, **kwargs):
         """Get a page"""
-        return self.fetch(requests.get, *args, **kwargs)
+        return self.fetch(self.cached_get, *args, **kwargs)
 
     def post(self, *args, **kwargs):
         """Submit a request"""
-        return self.fetch(requests.post, *args, **kwargs)
+        return self.fetch(self.get_session().post, *args, **kwargs)
 
     def post_html(self, url, data, parse_name, *args, **kwargs):
         """Post and return parsed HTML"""
@@ -241,7 +320,8 @@ class WebAoc:
                 f"the URL is wrong, or are you banned?")
             return None
 
-        return bs4.BeautifulSoup(response.text, "html.parser")
+        import bs4
+        return bs4.BeautifulSoup(response.text, get_html_parser_name())
 
     def as_text(self, response, name):
         """
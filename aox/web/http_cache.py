@@ -0,0 +1,142 @@
+import functools
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+__all__ = ['HttpCache', 'get_http_cache']
+
+
+@dataclass
+class HttpCache:
+    """
+    A file-backed cache of GET responses, that makes conditional requests with
+    the `ETag`/`Last-Modified` validators the site gave. If the page hasn't
+    changed, the site only replies with an empty `304`, and the cached body is
+    used instead.
+
+    Responses are only written to the disk when calling `save`, so that
+    fetching many pages writes the file once.
+    """
+    path: Path
+    entries: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False)
+    has_unsaved_entries: bool = field(default=False, repr=False, compare=False)
+
+    VALIDATOR_HEADERS = {
+        "ETag": "If-None-Match",
+        "Last-Modified": "If-Modified-Since",
+    }
+    """The response headers we store, and the request header for each"""
+
+    @classmethod
+    def from_path(cls, path: Path) -> 'HttpCache':
+        """Load the cache, starting from scratch if it's missing or corrupt"""
+        try:
+            entries = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+        return cls(path=path, entries=entries)
+
+    def get(self, session: 'requests.Session', url, headers=None, cookies=None,
+            **kwargs) -> 'requests.Response':
+        """
+        Get a page, asking the site to only send it if it changed since it
+        was cached
+        """
+        key = self.get_key(url, cookies)
+        entry = self.entries.get(key)
+        if entry:
+            headers = {
+                **(headers or {}),
+                **self.get_conditional_headers(entry),
+            }
+        response = session.get(url, headers=headers, cookies=cookies, **kwargs)
+        if entry and response.status_code == 304:
+            return self.make_cached_response(response, entry)
+        if response.ok:
+            self.update(key, response)
+        return response
+
+    def get_key(self, url, cookies=None) -> str:
+        """
+        The pages are different for each account, so the key also has a hash of
+        the session cookie, so that the session ID itself isn't stored
+
+        >>> HttpCache(Path()).get_key(
+        ...     'https://adventofcode.com/2020', {'session': 'abc'})
+        'ba7816bf8f01cfea:https://adventofcode.com/2020'
+        >>> HttpCache(Path()).get_key('https://adventofcode.com/2020')
+        ':https://adventofcode.com/2020'
+        """
+        session_id = (cookies or {}).get('session')
+        if session_id:
+            account_hash = hashlib.sha256(session_id.encode()).hexdigest()[:16]
+        else:
+            account_hash = ""
+        return f"{account_hash}:{url}"
+
+    def get_conditional_headers(self, entry: Dict[str, str]
+                                ) -> Dict[str, str]:
+        """
+        >>> HttpCache(Path()).get_conditional_headers(
+        ...     {'body': '', 'ETag': '"abc"', 'Last-Modified': 'yesterday'})
+        {'If-None-Match': '"abc"', 'If-Modified-Since': 'yesterday'}
+        >>> HttpCache(Path()).get_conditional_headers({'body': ''})
+        {}
+        """
+        return {
+            request_header: entry[response_header]
+            for response_header, request_header
+            in self.VALIDATOR_HEADERS.items()
+            if response_header in entry
+        }
+
+    def make_cached_response(self, response: 'requests.Response',
+                             entry: Dict[str, str]) -> 'requests.Response':
+        """Turn a `304` response into a normal one, with the cached body"""
+        import requests
+        cached_response = requests.Response()
+        cached_response.status_code = 200
+        cached_response.url = response.url
+        cached_response.headers = response.headers
+        cached_response.encoding = 'utf-8'
+        cached_response._content = entry['body'].encode('utf-8')
+        return cached_response
+
+    def update(self, key, response: 'requests.Response'):
+        """Cache a response, if the site gave a way to validate it later"""
+        validators = {
+            response_header: response.headers[response_header]
+            for response_header in self.VALIDATOR_HEADERS
+            if response_header in response.headers
+        }
+        if not validators:
+            return
+        with self.lock:
+            self.entries[key] = {"body": response.text, **validators}
+            self.has_unsaved_entries = True
+
+    def save(self):
+        """Write the cache to the disk, if any responses were added"""
+        with self.lock:
+            if not self.has_unsaved_entries:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.entries))
+            self.has_unsaved_entries = False
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_cache(path: Path) -> HttpCache:
+    """Get the cache for a path, only loading it from the disk once"""
+    return HttpCache.from_path(path)
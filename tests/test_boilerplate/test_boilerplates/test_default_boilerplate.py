@@ -56,6 +56,16 @@ class TestDefaultBoilerplate(TestCase):
                 DefaultBoilerplate().get_year_directory(2020),
                 Path('/tmp/test-directory/year_2020'))
 
+    def test_get_part_filename_follows_changed_root(self):
+        with amending_settings(challenges_root=Path('/tmp/test-directory')):
+            self.assertEqual(
+                DefaultBoilerplate().get_part_filename(2020, 5, 'a'),
+                Path('/tmp/test-directory/year_2020/day_05/part_a.py'))
+        with amending_settings(challenges_root=Path('/tmp/other-directory')):
+            self.assertEqual(
+                DefaultBoilerplate().get_part_filename(2020, 5, 'a'),
+                Path('/tmp/other-directory/year_2020/day_05/part_a.py'))
+
     def test_get_part_module_name_top_level_single_digit_day(self):
         with amending_settings(challenges_module_name_root=None):
             self.assertEqual(
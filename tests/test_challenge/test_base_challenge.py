@@ -22,6 +22,43 @@ class TestBaseChallenge(TestCase):
             self.assertEqual(
                 challenge.input, "Custom Input\nOver Multiple\nLines")
 
+    def test_input_is_read_again_after_changing(self):
+        with making_combined_info([(2020, 3, 'a')], None) as combined_info:
+            part = combined_info.get_part(2020, 3, 'a')
+            part.get_input_filename().write_text("First Input")
+            challenge = combined_info.get_challenge_instance(2020, 3, 'a')
+            self.assertEqual(challenge.input, "First Input")
+            part.get_input_filename().write_text("Second, Longer Input")
+            challenge = type(challenge)()
+            self.assertEqual(challenge.input, "Second, Longer Input")
+
+    def test_input_is_only_read_when_needed(self):
+        with making_combined_info([(2020, 3, 'a')], None) as combined_info:
+            part = combined_info.get_part(2020, 3, 'a')
+            challenge = combined_info.get_challenge_instance(2020, 3, 'a')
+            part.get_input_filename().unlink()
+            challenge = type(challenge)()
+            self.assertEqual(
+                (challenge.year, challenge.day, challenge.part),
+                (2020, 3, 'a'))
+            with self.assertRaises(FileNotFoundError):
+                # noinspection PyStatementEffect
+                challenge.input
+
+    def test_parsed_input_is_only_parsed_once(self):
+        with making_combined_info([(2020, 3, 'a')], None) as combined_info:
+            part = combined_info.get_part(2020, 3, 'a')
+            part.get_input_filename().write_text("1\n2\n3")
+            challenge = combined_info.get_challenge_instance(2020, 3, 'a')
+            challenge = type(challenge)()
+            with mock.patch.object(
+                    challenge, 'parse_input',
+                    side_effect=lambda _input: _input.splitlines()) \
+                    as mocked:
+                self.assertEqual(challenge.parsed_input, ['1', '2', '3'])
+                self.assertEqual(challenge.parsed_input, ['1', '2', '3'])
+                self.assertEqual(mocked.call_count, 1)
+
     def test_input_is_given_through_default_solve(self):
         with making_combined_info([(2020, 3, 'a')], None) as combined_info:
             part = combined_info.get_part(2020, 3, 'a')
@@ -36,6 +73,31 @@ class TestBaseChallenge(TestCase):
                     mock.call(
                         "Custom Input\nOver Multiple\nLines", debug=ANY))
 
+    def test_default_solve_counts_steps_without_a_debugger(self):
+        with making_combined_info([(2020, 3, 'a')], None) as combined_info:
+            challenge = combined_info.get_challenge_instance(2020, 3, 'a')
+            with mock.patch.object(
+                    challenge, 'solve',
+                    side_effect=lambda _input, debug: (
+                        debug.step(3).step_count, bool(debug))):
+                self.assertEqual(challenge.default_solve(""), (3, False))
+                self.assertEqual(challenge.default_solve(""), (3, False))
+
+    def test_nested_default_solve_doesnt_reset_the_outer_debugger(self):
+        with making_combined_info([(2020, 3, 'a')], None) as combined_info:
+            challenge = combined_info.get_challenge_instance(2020, 3, 'a')
+
+            def solve(_input, debug):
+                if _input == "outer":
+                    debug.step(2)
+                    challenge.default_solve("inner")
+                else:
+                    debug.step(5)
+                return debug.step_count
+
+            with mock.patch.object(challenge, 'solve', side_effect=solve):
+                self.assertEqual(challenge.default_solve("outer"), 2)
+
     def test_main_doesnt_run_if_not_main(self):
         with making_combined_info([(2020, 3, 'a')], None) as combined_info:
             challenge = combined_info.get_challenge_instance(2020, 3, 'a')
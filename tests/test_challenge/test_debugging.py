@@ -1,7 +1,8 @@
 from contextlib import contextmanager
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from aox.challenge import Debugger
+from aox.utils import Timer, DummyTimer
 from tests.utils import capturing_stdout, amending_settings
 
 
@@ -57,3 +58,49 @@ class TestDebugging(TestCase):
                     with debugger.adding_extra_report_format(
                             self.wrapping_debugger_format_3):
                         debugger.default_report("Hello")
+
+    def test_disabled_default_report_doesnt_format(self):
+        with mock.patch.object(self, 'concise_debugger_format') as mocked:
+            with self.assert_output(""):
+                debugger = Debugger(enabled=False)
+                debugger.default_report("Hello")
+                debugger.default_report_if("Hello")
+            self.assertEqual(mocked.call_count, 0)
+
+    def test_time_check_stride_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            Debugger(time_check_stride=0)
+        with self.assertRaises(ValueError):
+            Debugger(time_check_stride=-1)
+
+    def test_time_check_stride_with_multiple_steps(self):
+        debugger = Debugger(
+            min_report_interval_seconds=0, time_check_stride=4)
+        debugger.report().step()
+        # The step count since the last report is never a multiple of the
+        # stride, but the time should still be checked every 4 steps
+        results = [debugger.step(2).should_report() for _ in range(4)]
+        self.assertEqual(results, [False, True, False, True])
+
+    def test_changing_the_report_interval_between_reports(self):
+        debugger = Debugger(
+            timer=Timer(default_timer=DummyTimer()),
+            min_report_interval_seconds=100)
+        debugger.report()
+        self.assertFalse(debugger.should_report())
+        debugger.min_report_interval_seconds = 0
+        self.assertTrue(debugger.should_report())
+        debugger.report()
+        debugger.min_report_interval_seconds = 100
+        self.assertFalse(debugger.should_report())
+
+    def test_disabled_debugger_reports_dont_change_it(self):
+        for report_method in [
+                Debugger.report, Debugger.default_report,
+                Debugger.report_if, Debugger.default_report_if]:
+            with self.subTest(report_method=report_method.__name__):
+                debugger = Debugger(enabled=False).step(3)
+                with self.assert_output(""):
+                    report_method(debugger, "Hello")
+                self.assertEqual(debugger.step_count_since_last_report, 3)
+                self.assertIsNone(debugger.last_report_time)
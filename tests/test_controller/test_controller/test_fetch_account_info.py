@@ -76,3 +76,22 @@ class TestControllerFetchAccountInfo(TestCase):
             controller.combined_info.get_part(2020, 2, 'a').has_star)
         self.assertFalse(
             controller.combined_info.get_part(2020, 3, 'a').has_star)
+
+    def test_fetching_account_info_without_loaded_combined_info(self):
+        account_info = AccountInfo.from_collected_data({
+            "username": "Test User", "total_stars": 3, "years": {
+                2020: {"year": 2020, "stars": 3, "days": {
+                    1: 2,
+                    2: 1,
+                    3: 0,
+                }},
+            },
+        })
+        with self.preparing_to_fetch_info(account_info):
+            controller = Controller()
+            self.assertIsNone(controller.combined_info)
+            self.assertTrue(controller.fetch_account_info())
+        self.assertTrue(
+            controller.combined_info.get_part(2020, 2, 'a').has_star)
+        self.assertFalse(
+            controller.combined_info.get_part(2020, 3, 'a').has_star)
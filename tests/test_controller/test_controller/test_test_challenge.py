@@ -1,8 +1,12 @@
 import doctest
-from unittest import TestCase
+import multiprocessing
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
 
 from tests.test_controller.test_controller.test_boilerplate import \
     DummyBoilerplate
+from aox.testing import doctest_enhanced_testmod
 from tests.utils import using_controller, amending_settings
 
 
@@ -92,3 +96,52 @@ class TestControllerTestChallenge(TestCase):
         self.check_test_challenge(
             2020, 1, 'a', False, ['another'],
             original_replacement, doctest.TestResults(failed=0, attempted=1))
+
+    def test_testing_challenge_in_parallel(self):
+        self.check_test_challenge_in_parallel()
+
+    def test_testing_challenge_in_parallel_with_spawned_processes(self):
+        start_method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method('spawn', force=True)
+        try:
+            self.check_test_challenge_in_parallel()
+        finally:
+            multiprocessing.set_start_method(start_method, force=True)
+
+    def check_test_challenge_in_parallel(self):
+        original_replacement = (
+            "        return 42\n"
+            "\n"
+            "\n"
+            "import sys\n"
+            "Challenge.part_a_for_testing = sys.modules[__name__]\n"
+        )
+        with using_controller([], None, interactive=False) \
+                as (controller, combined_info, _), \
+                tempfile.TemporaryDirectory() as settings_directory, \
+                amending_settings(
+                    challenges_boilerplate=DummyBoilerplate(),
+                    parallel_doctests=True,
+                    settings_directory=Path(settings_directory)) as settings:
+            # Spawned workers can only load the settings from the disk
+            Path(settings_directory).joinpath('user_settings.py').write_text(
+                f"from pathlib import Path\n"
+                f"CHALLENGES_ROOT = Path({str(settings.challenges_root)!r})\n"
+                f"CHALLENGES_MODULE_NAME_ROOT = "
+                f"{settings.challenges_module_name_root!r}\n"
+            )
+            controller.add_challenge(2020, 1, 'a')
+            part_info = combined_info.get_part(2020, 1, 'a')
+            code = part_info.path.read_text()
+            code = code.replace(
+                '        "FUNCTION-BODY"', original_replacement)
+            part_info.path.write_text(code)
+            with mock.patch(
+                    'aox.controller.controller.testmod_with_filter',
+                    wraps=doctest_enhanced_testmod.testmod_with_filter) \
+                    as serial_testmod:
+                self.assertEqual(
+                    controller.test_challenge(2020, 1, 'a', False, []),
+                    doctest.TestResults(failed=0, attempted=2))
+            # The modules were only tested in the worker processes
+            self.assertEqual(serial_testmod.call_count, 0)
@@ -0,0 +1,49 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aox.model import AccountInfo
+from aox.model import account_info as account_info_module
+from tests.utils import amending_settings
+
+
+class TestAccountInfoFromCache(TestCase):
+    def test_unchanged_site_data_are_only_parsed_once(self):
+        account_info = AccountInfo.from_collected_data({
+            "username": "Test User", "total_stars": 3, "years": {
+                2020: {"year": 2020, "stars": 3, "days": {
+                    1: 2,
+                    2: 1,
+                }},
+            },
+        })
+        with tempfile.TemporaryDirectory() as directory:
+            site_data_path = Path(directory).joinpath('site_data.json')
+            site_data_path.write_text(json.dumps(account_info.serialise()))
+            json_loads = mock.Mock(wraps=json.loads)
+            with amending_settings(site_data_path=site_data_path), \
+                    mock.patch.object(
+                        account_info_module, 'get_json_loads',
+                        return_value=json_loads):
+                for _ in range(2):
+                    self.assertEqual(
+                        AccountInfo.from_cache().serialise(),
+                        account_info.serialise())
+            self.assertEqual(json_loads.call_count, 1)
+
+    def test_changed_site_data_are_parsed_again(self):
+        with tempfile.TemporaryDirectory() as directory:
+            site_data_path = Path(directory).joinpath('site_data.json')
+            with amending_settings(site_data_path=site_data_path):
+                self.assertIsNone(AccountInfo.from_cache())
+                site_data_path.write_text(json.dumps(
+                    {"username": "Test User", "total_stars": 0,
+                     "years": {}, "version": 2}))
+                self.assertEqual(
+                    AccountInfo.from_cache().username, "Test User")
+                site_data_path.write_text(json.dumps(
+                    {"username": "Other User", "total_stars": 0,
+                     "years": {}, "version": 2}))
+                self.assertEqual(
+                    AccountInfo.from_cache().username, "Other User")
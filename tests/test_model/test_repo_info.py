@@ -5,12 +5,31 @@ from datetime import datetime
 from pathlib import Path
 from unittest import TestCase
 
-from aox.boilerplate import DefaultBoilerplate
+from aox.boilerplate import BaseBoilerplate, DefaultBoilerplate
 from aox.model import RepoInfo
 from aox.settings import settings_proxy
 from tests.utils import amending_settings
 
 
+class FlatBoilerplate(BaseBoilerplate):
+    """A boilerplate without a base directory, with all parts side by side"""
+    def __init__(self, root: Path):
+        self.root = root
+
+    def get_year_directory(self, year: int, relative: bool = False):
+        return self.root
+
+    def get_day_directory(self, year: int, day: int, relative: bool = False):
+        return self.root
+
+    def get_part_filename(self, year: int, day: int, part: str,
+                          relative: bool = False):
+        return self.root.joinpath(f"year_{year}_day_{day:0>2}_{part}.py")
+
+    def get_part_module_name(self, year: int, day: int, part: str):
+        return f"year_{year}_day_{day:0>2}_{part}"
+
+
 # noinspection DuplicatedCode
 class TestRepoInfoFromDisk(TestCase):
     def test_empty_directory(self):
@@ -172,3 +191,22 @@ class TestRepoInfoFromDisk(TestCase):
                             self.assertEqual(part_info.year, year)
                             self.assertEqual(part_info.day, day)
                             self.assertEqual(part_info.part, part)
+
+    def test_boilerplate_without_base_directory(self):
+        with tempfile.TemporaryDirectory() as challenges_root:
+            boilerplate = FlatBoilerplate(Path(challenges_root))
+            with amending_settings(
+                    challenges_root=Path(challenges_root),
+                    challenges_boilerplate=boilerplate):
+                boilerplate.get_part_filename(2020, 3, 'b').touch()
+
+                repo_info = RepoInfo.from_roots()
+
+                self.assertTrue(repo_info.has_code)
+                self.assertEqual({
+                    (part_info.year, part_info.day, part_info.part)
+                    for year_info in repo_info.year_infos.values()
+                    for day_info in year_info.day_infos.values()
+                    for part_info in day_info.part_infos.values()
+                    if part_info.has_code
+                }, {(2020, 3, 'b')})
@@ -1,4 +1,5 @@
-from unittest import TestCase
+import importlib.util
+from unittest import TestCase, mock, skipUnless
 
 import responses
 
@@ -104,3 +105,53 @@ class TestAccountScraperScraper(TestCase):
                 25: 0,
             },
         })
+
+    @responses.activate
+    def test_collect_years_keeps_the_order_of_the_years(self):
+        for year in (2020, 2019, 2018):
+            responses.add(
+                responses.GET, f'https://adventofcode.com/{year}',
+                body=web_fixtures.joinpath('2020.html').read_bytes(),
+                status=200,
+            )
+        responses.add(
+            responses.GET, 'https://adventofcode.com/2017',
+            body=b'Oops',
+            status=500,
+        )
+
+        scraper = AccountScraper(WebAoc('test-session'))
+        years_data = scraper.collect_years(
+            {2020: 39, 2019: 20, 2018: 10, 2017: 5})
+        self.assertEqual(len(responses.calls), 4)
+        self.assertEqual(
+            [year_data and year_data["year"] for year_data in years_data],
+            [2020, 2019, 2018, None])
+
+    @skipUnless(importlib.util.find_spec('lxml'), "lxml is not installed")
+    def test_collect_data_is_the_same_with_either_parser(self):
+        collected_data_by_parser_name = {}
+        for parser_name in ('html.parser', 'lxml'):
+            with responses.RequestsMock() as requests_mock, \
+                    mock.patch(
+                        'aox.web.aoc.get_html_parser_name',
+                        return_value=parser_name):
+                requests_mock.add(
+                    responses.GET, 'https://adventofcode.com/events',
+                    body=web_fixtures.joinpath('events.html').read_bytes(),
+                    status=200,
+                )
+                requests_mock.add(
+                    responses.GET, 'https://adventofcode.com/2020',
+                    body=web_fixtures.joinpath('2020.html').read_bytes(),
+                    status=200,
+                )
+                scraper = AccountScraper(WebAoc('test-session'))
+                collected_data_by_parser_name[parser_name] = \
+                    scraper.collect_data()
+
+        self.assertEqual(
+            collected_data_by_parser_name['lxml'],
+            collected_data_by_parser_name['html.parser'])
+        self.assertEqual(
+            collected_data_by_parser_name['lxml']["total_stars"], 39)
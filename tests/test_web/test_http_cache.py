@@ -0,0 +1,100 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import requests
+import responses
+
+from aox.web import HttpCache
+
+
+class TestHttpCache(TestCase):
+    def add_conditional_response(self, url, body, etag):
+        def callback(request):
+            if request.headers.get('If-None-Match') == etag:
+                return 304, {'ETag': etag}, ''
+            return 200, {'ETag': etag}, body
+
+        responses.add_callback(responses.GET, url, callback=callback)
+
+    @responses.activate
+    def test_unchanged_page_is_served_from_the_cache(self):
+        url = 'https://adventofcode.com/2020'
+        self.add_conditional_response(url, 'Year page', '"v1"')
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('http_cache.json')
+            session = requests.Session()
+            http_cache = HttpCache.from_path(path)
+
+            first_response = http_cache.get(session, url)
+            self.assertEqual(first_response.status_code, 200)
+            self.assertEqual(first_response.text, 'Year page')
+            http_cache.save()
+            self.assertEqual(json.loads(path.read_text()), {
+                f':{url}': {'body': 'Year page', 'ETag': '"v1"'},
+            })
+
+            second_response = HttpCache.from_path(path).get(session, url)
+            self.assertEqual(len(responses.calls), 2)
+            self.assertEqual(
+                responses.calls[1].request.headers['If-None-Match'], '"v1"')
+            self.assertEqual(second_response.status_code, 200)
+            self.assertTrue(second_response.ok)
+            self.assertEqual(second_response.text, 'Year page')
+
+    @responses.activate
+    def test_pages_are_cached_per_account(self):
+        url = 'https://adventofcode.com/2020'
+        self.add_conditional_response(url, 'Year page', '"v1"')
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('http_cache.json')
+            session = requests.Session()
+            http_cache = HttpCache.from_path(path)
+
+            http_cache.get(session, url, cookies={'session': 'first'})
+            http_cache.get(session, url, cookies={'session': 'second'})
+            self.assertNotIn(
+                'If-None-Match', responses.calls[1].request.headers)
+            self.assertEqual(len(http_cache.entries), 2)
+            http_cache.save()
+            self.assertNotIn('first', path.read_text())
+
+    @responses.activate
+    def test_responses_are_only_written_when_saving(self):
+        urls = [
+            'https://adventofcode.com/2019',
+            'https://adventofcode.com/2020',
+        ]
+        for url in urls:
+            self.add_conditional_response(url, 'Year page', '"v1"')
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('http_cache.json')
+            session = requests.Session()
+            http_cache = HttpCache.from_path(path)
+
+            for url in urls:
+                http_cache.get(session, url)
+            self.assertFalse(path.exists())
+            http_cache.save()
+            self.assertEqual(len(json.loads(path.read_text())), 2)
+
+    @responses.activate
+    def test_responses_without_validators_are_not_cached(self):
+        url = 'https://adventofcode.com/2020'
+        responses.add(responses.GET, url, body='Year page', status=200)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('http_cache.json')
+            http_cache = HttpCache.from_path(path)
+
+            response = http_cache.get(requests.Session(), url)
+            self.assertEqual(response.text, 'Year page')
+            self.assertEqual(http_cache.entries, {})
+            http_cache.save()
+            self.assertFalse(path.exists())
+
+    def test_corrupt_cache_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath('http_cache.json')
+            path.write_text('{not json')
+            self.assertEqual(HttpCache.from_path(path).entries, {})